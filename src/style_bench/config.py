@@ -1,8 +1,12 @@
 import yaml
+from functools import lru_cache
 from typing import Optional
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 from pathlib import Path
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class SyntacticConfig(BaseModel):
     pos_frequency: bool = True
@@ -34,12 +38,16 @@ class LexicalConfig(BaseModel):
     density: bool = True
     legomena: LegomenaConfig = LegomenaConfig()
     sentiment: SentimentConfig = SentimentConfig()
+    # Most processes used for the per-text metrics; None allows every core.
+    # Small corpora run in-process regardless
+    workers: Optional[int] = Field(default=None, ge=1)
 
 
 class DataConfig(BaseModel):
     data_path: str
     target_key: str = "answer"
     output_path: str = "output/"
+    save_pickle: bool = False
 
     @field_validator("data_path")
     def validate_data_path(cls, v: str) -> str:
@@ -60,11 +68,6 @@ class DataConfig(BaseModel):
 
         return str(path)
 
-    @field_validator("output_path")
-    def create_output_path(cls, v):
-        Path(v).mkdir(parents=True, exist_ok=True)
-        return v
-
 
 class AnalysisConfig(BaseModel):
     lexical: LexicalConfig = LexicalConfig()
@@ -76,8 +79,25 @@ class AnalysisConfig(BaseModel):
     description: Optional[str] = None
 
 
-def load_config(config_path: str) -> AnalysisConfig:
-    """Load and validate configuration from YAML file"""
+@lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime_ns: int) -> AnalysisConfig:
+    """Parse and validate a config file; mtime_ns only serves as cache key"""
     with open(config_path, "r") as f:
-        config_dict = yaml.safe_load(f)
+        config_dict = yaml.load(f, Loader=Loader)
     return AnalysisConfig(**config_dict)
+
+
+def load_config(config_path: str) -> AnalysisConfig:
+    """Load and validate configuration from YAML file
+
+    Parsed configs are cached by path and modification time, so an edited
+    file is re-read. Every call returns its own copy.
+    """
+    path = Path(config_path).resolve()
+    config = _load_config_cached(str(path), path.stat().st_mtime_ns)
+
+    # The data path may be relative to the working directory or removed
+    # since it was cached, so check it again on every load
+    DataConfig.model_validate(config.data.model_dump())
+
+    return config.model_copy(deep=True)
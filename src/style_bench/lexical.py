@@ -1,177 +1,513 @@
-import string
+import multiprocessing
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import fields, is_dataclass
+from functools import cache, partial
+from typing import Optional
 
-from scipy import stats
 from tqdm import tqdm
-import nltk
 import numpy as np
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 
-from transformers import pipeline
-
-from .models import LexicalMetrics
+from .models import LexicalMetrics, Sentiment
 from .config import LexicalConfig
 
+try:
+    from numba import njit
+except ImportError:  # optional "fast" extra, the NumPy kernels below are used instead
+    njit = None
+
+# Words are runs of Unicode letters and digits ("café", "1984", "word0"),
+# optionally joined by apostrophes ("don't"); numbers count as words, as
+# they did with word_tokenize. Punctuation never matches so no separate
+# filtering pass is needed
+WORD_PATTERN = re.compile(r"[^\W_]+(?:'[^\W_]+)*")
+
+# NLTK data used by the lexical metrics, as (package, resource path)
+NLTK_RESOURCES = (("stopwords", "corpora/stopwords"),)
+
+# Worker processes must not inherit the sentiment model (and a CUDA context)
+# by forking this process; Windows has no forkserver but spawns anyway
+START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Starting a worker (a fresh interpreter importing numpy and numba) costs as
+# much as analyzing a few thousand texts, so smaller corpora run in-process
+MIN_TEXTS_PER_WORKER = 2000
+
+
+@cache
+def _ensure_nltk_data() -> None:
+    """Download missing NLTK data, checking at most once per process"""
+    import nltk
+
+    for package, resource in NLTK_RESOURCES:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package, quiet=True)
+
+
+@cache
+def _load_stop_words() -> frozenset:
+    """English stopwords, read from the NLTK corpus once per process"""
+    from nltk.corpus import stopwords
+
+    return frozenset(stopwords.words("english"))
+
+
+# === Tokens ===
+def _count_tokens(words: list, stop_words: frozenset) -> tuple:
+    """Count the words and function words of a text
+
+    Both counts run in C (Counter's counting helper and map over the
+    frozenset's __contains__), so no Python code runs per word.
+
+    Args:
+        words (list): Words of a single lowercased text
+        stop_words (frozenset): Function words to count
+
+    Returns:
+        tuple: A Counter of the words and the number of function words
+            among them
+    """
+    word_counts = Counter(words)
+    function_word_count = sum(map(stop_words.__contains__, words))
+
+    return word_counts, function_word_count
+
+
+# === Word Length ===
+def _calculate_word_length(words: list) -> tuple:
+    """Mean, standard deviation, skew and kurtosis of word lengths
+
+    Args:
+        words (list): Words of the text
+
+    Returns:
+        tuple: (mean, std, skew, kurtosis)
+    """
+    if not words:
+        return 0.0, 0.0, 0.0, 0.0
+
+    # map(len) runs in C, without an intermediate list of lengths
+    mean, var, m3, m4 = _central_moments(
+        np.fromiter(map(len, words), dtype=np.int32, count=len(words))
+    )
+    if var == 0:
+        return float(mean), 0.0, float("nan"), float("nan")
+
+    # Biased skew and Fisher kurtosis, matching the scipy.stats defaults
+    skew = m3 / var**1.5
+    kurtosis = m4 / var**2 - 3
+
+    return float(mean), float(np.sqrt(var)), float(skew), float(kurtosis)
+
+
+def _central_moments_numpy(values: np.ndarray) -> tuple:
+    """Mean and second to fourth central moments of a non-empty array"""
+    mean = values.mean()
+    d = values - mean
+    d2 = d * d
+    return mean, d2.mean(), (d2 * d).mean(), (d2 * d2).mean()
+
+
+def _central_moments_loop(values: np.ndarray) -> tuple:
+    """Loop form of _central_moments_numpy, compiled when numba is present"""
+    n = values.size
+    total = 0.0
+    for value in values:
+        total += value
+    mean = total / n
+
+    m2 = m3 = m4 = 0.0
+    for value in values:
+        d = value - mean
+        d2 = d * d
+        m2 += d2
+        m3 += d2 * d
+        m4 += d2 * d2
+    return mean, m2 / n, m3 / n, m4 / n
+
+
+# === Function Words ===
+def _calculate_function_word_frequency(
+    function_word_count: int, total_words: int
+) -> float:
+    """Share of words that are function (stop) words
+
+    Args:
+        function_word_count (int): Number of function words in the text
+        total_words (int): Number of words in the text
+
+    Returns:
+        float: Function word frequency
+    """
+    return function_word_count / total_words if total_words else 0
+
+
+# === Richness ===
+def _calculate_richness(words: list, word_counts: Counter, window: int = 100) -> tuple:
+    # TTR (Type-Token Ratio)
+    ttr = len(word_counts) / len(words) if words else 0
+
+    # MATTR (Moving-Average Type-Token Ratio)
+    # ensure window is not larger than the number of words
+    if len(words) < window:
+        mattr = ttr
+    else:
+        vocab = {word: i for i, word in enumerate(word_counts)}
+        ids = np.fromiter(
+            map(vocab.__getitem__, words), dtype=np.int32, count=len(words)
+        )
+        mattr = _moving_average_ttr(ids, len(vocab), window)
+
+    return float(ttr), float(mattr)
+
+
+def _moving_average_ttr_numpy(ids: np.ndarray, vocab_size: int, window: int) -> float:
+    """Mean TTR over every window of `window` consecutive words
+
+    Args:
+        ids (np.ndarray): Integer id of each word, in text order
+        vocab_size (int): Number of distinct ids
+        window (int): Window size, no larger than the number of words
+
+    Returns:
+        float: MATTR
+    """
+    n = ids.size
+    positions = np.arange(n)
+
+    # Previous occurrence of each word, -1 for its first occurrence
+    order = np.argsort(ids, kind="stable")
+    repeated = ids[order[1:]] == ids[order[:-1]]
+    previous = np.full(n, -1)
+    previous[order[1:][repeated]] = order[:-1][repeated]
+
+    # Word j is a new type in every window that covers it but not its
+    # previous occurrence; accumulate those start ranges as a difference
+    # array so each window's type count falls out of one cumsum
+    last_start = n - window
+    start = np.maximum(previous + 1, positions - window + 1)
+    stop = np.minimum(positions, last_start)
+    valid = start <= stop
+    diff = np.bincount(start[valid], minlength=last_start + 2) - np.bincount(
+        stop[valid] + 1, minlength=last_start + 2
+    )
+    types_per_window = np.cumsum(diff[: last_start + 1])
+
+    return float(types_per_window.mean() / window)
+
+
+def _moving_average_ttr_loop(ids: np.ndarray, vocab_size: int, window: int) -> float:
+    """Loop form of _moving_average_ttr_numpy, compiled when numba is present
+
+    Slides the window one word at a time, keeping a count per id and the
+    number of ids currently in the window.
+    """
+    counts = np.zeros(vocab_size, dtype=np.int32)
+    types = 0
+    for j in range(window):
+        if counts[ids[j]] == 0:
+            types += 1
+        counts[ids[j]] += 1
+
+    total = types
+    for j in range(window, ids.size):
+        leaving = ids[j - window]
+        counts[leaving] -= 1
+        if counts[leaving] == 0:
+            types -= 1
+        entering = ids[j]
+        if counts[entering] == 0:
+            types += 1
+        counts[entering] += 1
+        total += types
+
+    return total / ((ids.size - window + 1) * window)
+
+
+if njit is not None:
+    _central_moments = njit(cache=True)(_central_moments_loop)
+    _moving_average_ttr = njit(cache=True)(_moving_average_ttr_loop)
+else:
+    _central_moments = _central_moments_numpy
+    _moving_average_ttr = _moving_average_ttr_numpy
+
+
+# === Legomena ===
+def _calculate_legomena(word_counts: Counter, total_words: int) -> tuple:
+    """Calculate hapax, dislegomena, and trilegomina ratios"""
+    # How many words occur once, twice, ...; counted in C by Counter
+    count_frequencies = Counter(word_counts.values())
+    hapax = count_frequencies[1]
+    dislegomena = count_frequencies[2]
+    trilegomina = count_frequencies[3]
+
+    return (
+        hapax / total_words if total_words else 0,
+        dislegomena / total_words if total_words else 0,
+        trilegomina / total_words if total_words else 0,
+    )
+
+
+def _allocate(group, n: int) -> list[np.ndarray]:
+    """Give every metric field of a results group an empty array of length n
+
+    Returns:
+        list[np.ndarray]: The new arrays, in field order
+    """
+    arrays = []
+    for metric in fields(group):
+        setattr(group, metric.name, np.empty(n))
+        arrays.append(getattr(group, metric.name))
+    return arrays
+
+
+def _expand(metrics, inverse: np.ndarray) -> None:
+    """Reindex every computed array of a results dataclass by inverse
+
+    Nested groups are handled recursively; metrics that were not computed
+    are left empty.
+    """
+    for metric in fields(metrics):
+        value = getattr(metrics, metric.name)
+        if is_dataclass(value):
+            _expand(value, inverse)
+        elif value.size:
+            setattr(metrics, metric.name, value[inverse])
+
+
+# === Per-text analysis ===
+# Each step maps the fused token pass of one text to a tuple of metric
+# values, in the field order of the matching LexicalMetrics group
+def _function_words_step(tokens, word_counts, function_word_count):
+    return (_calculate_function_word_frequency(function_word_count, len(tokens)),)
+
+
+def _word_length_step(tokens, word_counts, function_word_count):
+    return _calculate_word_length(tokens)
+
+
+def _richness_step(tokens, word_counts, function_word_count):
+    return _calculate_richness(tokens, word_counts)
+
+
+def _legomena_step(tokens, word_counts, function_word_count):
+    return _calculate_legomena(word_counts, len(tokens))
+
+
+METRIC_STEPS = {
+    "function_words": _function_words_step,
+    "word_length": _word_length_step,
+    "richness": _richness_step,
+    "legomena": _legomena_step,
+}
+
+
+def _enabled_metrics(config: LexicalConfig) -> frozenset:
+    """Names of the per-text metrics switched on in the config"""
+    enabled = {
+        "function_words": config.function_words,
+        "word_length": config.word_length,
+        "richness": config.richness.mattr,
+        "legomena": config.legomena.hapax
+        or config.legomena.dislegomena
+        or config.legomena.trilegomina,
+    }
+    return frozenset(name for name, on in enabled.items() if on)
+
+
+def _worker_count(workers: Optional[int], n: int) -> int:
+    """Processes to analyze n distinct texts with, 1 meaning in-process
+
+    Args:
+        workers (Optional[int]): Configured worker limit, None for every core
+        n (int): Number of distinct texts
+
+    Returns:
+        int: At most one worker per MIN_TEXTS_PER_WORKER texts, and at least 1
+    """
+    workers = workers or os.cpu_count() or 1
+    return max(1, min(workers, n // MIN_TEXTS_PER_WORKER))
+
+
+def _analyze_text(text: str, steps: tuple, stop_words: frozenset) -> list:
+    """Compute the enabled lexical metrics for a single text
+
+    Kept at module level so it can be shipped to worker processes.
+
+    Args:
+        text (str): Text to analyze
+        steps (tuple): Metric steps to run, from METRIC_STEPS
+        stop_words (frozenset): Function words
+
+    Returns:
+        list: The values of every step, flattened in step order, or None
+            for a text without words, which scores zero on every metric
+    """
+    tokens = WORD_PATTERN.findall(text.lower())
+    if not tokens:
+        return None
+    counts = _count_tokens(tokens, stop_words)
+
+    values = []
+    for step in steps:
+        values.extend(step(tokens, *counts))
+    return values
+
 
 class LexicalComputer:
     def __init__(self, config: LexicalConfig):
-        # Download required NLTK data
-        nltk.download("punkt")
-        nltk.download("stopwords")
-        nltk.download("averaged_perceptron_tagger_eng")
-        nltk.download("averaged_perceptron_tagger")
-        self.stop_words = set(stopwords.words("english"))
+        _ensure_nltk_data()
+        self.stop_words = _load_stop_words()
         self.config = config
+        self.metrics = _enabled_metrics(config)
+        # Only the enabled steps are run, so the per-text loop has no
+        # config checks left in it
+        self.steps = tuple(
+            step for name, step in METRIC_STEPS.items() if name in self.metrics
+        )
+
+        if self.config.sentiment:
+            if self.config.sentiment.batch_size is None:
+                print("Setting batch size to 64 for sentiment analysis")
+                self.config.sentiment.batch_size = 64
+            self.classifier = self._load_classifier(self.config.sentiment.model_name)
 
     def analyze_corpus(self, texts: list[str], smoothed=False) -> LexicalMetrics:
         lexical_metrics = LexicalMetrics()
 
-        pbar = tqdm(
-            texts,
-            desc="🔍 Analyzing texts",
-            unit="text",
-            ncols=100,  # Width of progress bar
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
-            colour="green",
+        # Duplicate texts (boilerplate, repeated answers) are analyzed once;
+        # their results are copied back to every position at the end
+        unique_texts = list(dict.fromkeys(texts))
+        n = len(unique_texts)
+
+        # Preallocate one array per value of each enabled step, in the same
+        # order the steps emit them, and fill them by index
+        columns = []
+        for name in METRIC_STEPS:
+            if name not in self.metrics:
+                continue
+            if name == "function_words":
+                lexical_metrics.function_word_frequency = np.empty(n)
+                columns.append(lexical_metrics.function_word_frequency)
+            else:
+                columns.extend(_allocate(getattr(lexical_metrics, name), n))
+
+        # Texts are independent, so spread them over the worker processes
+        # with a few chunks per worker to keep pickling overhead low; a
+        # single worker runs in this process instead
+        workers = _worker_count(self.config.workers, n)
+        chunksize = max(1, n // (4 * workers))
+        analyze_text = partial(
+            _analyze_text, steps=self.steps, stop_words=self.stop_words
+        )
+        executor = (
+            ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(START_METHOD),
+            )
+            if workers > 1
+            else None
         )
 
-        for text in pbar:
-            words = word_tokenize(text.lower())
-            words_no_punct = [word for word in words if word not in string.punctuation]
+        with executor or nullcontext():
+            pbar = tqdm(
+                executor.map(analyze_text, unique_texts, chunksize=chunksize)
+                if executor
+                else map(analyze_text, unique_texts),
+                total=n,
+                desc="🔍 Analyzing texts",
+                unit="text",
+                ncols=100,  # Width of progress bar
+                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
+                colour="green",
+            )
 
-            # Function words
-            if self.config.function_words:
-                function_word_frequency = self._calculate_function_word_frequency(
-                    words_no_punct
-                )
-                lexical_metrics.function_word_frequency.append(function_word_frequency)
-
-            # Word lengths
-            if self.config.word_length:
-                (
-                    avg_word_length,
-                    std_word_length,
-                    skew_word_length,
-                    kurtosis_word_length,
-                ) = self._calculate_word_length(words_no_punct)
-                lexical_metrics.word_length.avg.append(avg_word_length)
-                lexical_metrics.word_length.std.append(std_word_length)
-                lexical_metrics.word_length.skew.append(skew_word_length)
-                lexical_metrics.word_length.kurtosis.append(kurtosis_word_length)
-
-            # Richness
-            if self.config.richness.mattr or self.config.richness.ttr:
-                ttr, mattr = self._calculate_richness(words_no_punct)
-                lexical_metrics.richness.ttr.append(ttr)
-                lexical_metrics.richness.mattr.append(mattr)
-
-            # Legomena
-            if (
-                self.config.legomena.hapax
-                or self.config.legomena.dislegomena
-                or self.config.legomena.trilegomina
-            ):
-                hapax, dis, tri = self._calculate_legomena(words_no_punct)
-                lexical_metrics.legomena.hapax.append(hapax)
-                lexical_metrics.legomena.dislegomena.append(dis)
-                lexical_metrics.legomena.trilegomina.append(tri)
+            # One row store per text, then whole-column copies, instead of a
+            # scalar store for every value; texts without words keep zeros
+            rows = np.zeros((n, len(columns)))
+            for i, values in enumerate(pbar):
+                if values is not None:
+                    rows[i] = values
+
+        for column, values in zip(columns, rows.T):
+            column[:] = values
 
         # Sentiment
         if self.config.sentiment:
-            if self.config.sentiment.batch_size is None:
-                print("Setting batch size to 64 for sentiment analysis")
-                self.config.sentiment.batch_size = 64
-            classifier = pipeline(
-                "text-classification",
-                model=self.config.sentiment.model_name,
-                return_all_scores=True,
+            # Look up each emotion's array once rather than per prediction
+            emotions = dict(
+                zip(
+                    (emotion.name for emotion in fields(lexical_metrics.sentiment)),
+                    _allocate(lexical_metrics.sentiment, n),
+                )
             )
-            results = classifier(
-                texts, truncation=True, batch_size=self.config.sentiment.batch_size
+            results = self.classifier(
+                unique_texts,
+                truncation=True,
+                batch_size=self.config.sentiment.batch_size,
             )
 
-            for result in results:
-                lexical_metrics.sentiment.anger.append(result[0]["score"])
-                lexical_metrics.sentiment.disgust.append(result[1]["score"])
-                lexical_metrics.sentiment.fear.append(result[2]["score"])
-                lexical_metrics.sentiment.joy.append(result[3]["score"])
-                lexical_metrics.sentiment.neutral.append(result[4]["score"])
-                lexical_metrics.sentiment.sadness.append(result[5]["score"])
-                lexical_metrics.sentiment.surprise.append(result[6]["score"])
-
-        return lexical_metrics
+            for i, result in enumerate(results):
+                for prediction in result:
+                    emotions[prediction["label"].lower()][i] = prediction["score"]
 
-    # === Word Length ===
-    def _calculate_word_length(self, words: list) -> tuple:
-        """_summary_
-
-        Args:
-            words (list): _description_
-
-        Returns:
-            float: _description_
-        """
-        mean = np.mean([len(word) for word in words]) if words else 0
-        std = np.std([len(word) for word in words]) if words else 0
-        skew = stats.skew([len(word) for word in words]) if words else 0
-        kurtosis = stats.kurtosis([len(word) for word in words]) if words else 0
-
-        return float(mean), float(std), float(skew), float(kurtosis)
-
-    # === Function Words ===
-    def _calculate_function_word_frequency(self, words: list) -> float:
-        """_summary_
-
-        Args:
-            words (list): _description_
-
-        Returns:
-            float: _description_
-        """
-        function_word_count = sum(1 for word in words if word in self.stop_words)
-        return function_word_count / len(words) if words else 0
-
-    # === Richness ===
-    def _calculate_richness(self, words: list, window: int = 100) -> tuple:
-        # TTR (Type-Token Ratio)
-        unique_words = set(words)
-        ttr = len(unique_words) / len(words) if words else 0
-
-        # MATTR (Moving-Average Type-Token Ratio)
-        # ensure window is not larger than the number of words
-        if len(words) < window:
-            mattr = ttr
-        else:
-            mattr = np.mean(
-                [
-                    len(set(words[i : i + window])) / window
-                    for i in range(0, len(words), window)
-                ]
+        if n < len(texts):
+            position = {text: i for i, text in enumerate(unique_texts)}
+            _expand(
+                lexical_metrics,
+                np.fromiter(map(position.__getitem__, texts), dtype=np.intp),
             )
 
-        return float(ttr), float(mattr)
+        return lexical_metrics
 
-    # === Legomena ===
-    def _calculate_legomena(self, words: list) -> tuple:
-        """Calculate hapax, dislegomena, and trilegomina ratios"""
-        word_counts = nltk.FreqDist(words)
-        hapax = sum(1 for count in word_counts.values() if count == 1)
-        dislegomena = sum(1 for count in word_counts.values() if count == 2)
-        trilegomina = sum(1 for count in word_counts.values() if count == 3)
+    # === Sentiment ===
+    def _load_classifier(self, model_name: str):
+        """Load the emotion classifier once, in half precision on a GPU if present"""
+        # transformers takes seconds to import, so only pay for it when
+        # sentiment is actually computed
+        from transformers import pipeline
+        from transformers.utils import is_torch_cuda_available
 
-        return (
-            hapax / len(words) if words else 0,
-            dislegomena / len(words) if words else 0,
-            trilegomina / len(words) if words else 0,
-        )
+        if is_torch_cuda_available():
+            import torch
+
+            device, dtype = 0, torch.float16
+        else:
+            device, dtype = -1, None
 
-    def _sentiment(self, words: list) -> float:
         classifier = pipeline(
             "text-classification",
-            model="j-hartmann/emotion-english-distilroberta-base",
-            return_all_scores=True,
+            model=model_name,
+            top_k=None,
+            device=device,
+            torch_dtype=dtype,
         )
-        joined_text = " ".join(words)
-        results = classifier(joined_text)
+        _check_emotion_labels(model_name, classifier.model.config.id2label.values())
+
+        return classifier
+
 
-        return results
+def _check_emotion_labels(model_name: str, labels) -> None:
+    """Ensure a model predicts exactly the emotions of the Sentiment results
+
+    Labels are compared case-insensitively, as the scores are stored under
+    the lowercased label.
+
+    Raises:
+        ValueError: If any label has no matching emotion or vice versa
+    """
+    emotions = {emotion.name for emotion in fields(Sentiment)}
+    unknown = sorted(label for label in labels if label.lower() not in emotions)
+    missing = sorted(emotions - {label.lower() for label in labels})
+    if unknown or missing:
+        raise ValueError(
+            f"Sentiment model {model_name} does not predict the expected emotions: "
+            f"unknown labels {unknown}, missing labels {missing}"
+        )
@@ -1,56 +1,63 @@
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import Dict
 
+import numpy as np
 
-@dataclass
+
+def _empty() -> np.ndarray:
+    """Placeholder for a metric that has not been computed"""
+    return np.empty(0)
+
+
+@dataclass(slots=True)
 class WordLength:
-    avg: List[float] = field(default_factory=list)
-    std: List[float] = field(default_factory=list)
-    skew: List[float] = field(default_factory=list)
-    kurtosis: List[float] = field(default_factory=list)
+    avg: np.ndarray = field(default_factory=_empty)
+    std: np.ndarray = field(default_factory=_empty)
+    skew: np.ndarray = field(default_factory=_empty)
+    kurtosis: np.ndarray = field(default_factory=_empty)
 
 
-@dataclass
+@dataclass(slots=True)
 class Richness:
-    ttr: List[float] = field(default_factory=list)
-    mattr: List[float] = field(default_factory=list)
+    ttr: np.ndarray = field(default_factory=_empty)
+    mattr: np.ndarray = field(default_factory=_empty)
 
 
-@dataclass
+@dataclass(slots=True)
 class Legomena:
-    hapax: List[int] = field(default_factory=list)
-    dislegomena: List[int] = field(default_factory=list)
-    trilegomina: List[int] = field(default_factory=list)
+    hapax: np.ndarray = field(default_factory=_empty)
+    dislegomena: np.ndarray = field(default_factory=_empty)
+    trilegomina: np.ndarray = field(default_factory=_empty)
 
 
-@dataclass
+@dataclass(slots=True)
 class Sentiment:
-    anger: List[float] = field(default_factory=list)
-    disgust: List[float] = field(default_factory=list)
-    fear: List[float] = field(default_factory=list)
-    joy: List[float] = field(default_factory=list)
-    neutral: List[float] = field(default_factory=list)
-    sadness: List[float] = field(default_factory=list)
-    surprise: List[float] = field(default_factory=list)
+    anger: np.ndarray = field(default_factory=_empty)
+    disgust: np.ndarray = field(default_factory=_empty)
+    fear: np.ndarray = field(default_factory=_empty)
+    joy: np.ndarray = field(default_factory=_empty)
+    neutral: np.ndarray = field(default_factory=_empty)
+    sadness: np.ndarray = field(default_factory=_empty)
+    surprise: np.ndarray = field(default_factory=_empty)
 
 
-@dataclass
+@dataclass(slots=True)
 class LexicalMetrics:
     word_length: WordLength = field(default_factory=WordLength)
-    function_word_frequency: List[float] = field(default_factory=list)
+    function_word_frequency: np.ndarray = field(default_factory=_empty)
     richness: Richness = field(default_factory=Richness)
     legomena: Legomena = field(default_factory=Legomena)
     sentiment: Sentiment = field(default_factory=Sentiment)
 
 
-@dataclass
+@dataclass(slots=True)
 class SyntacticMetrics:
     pos_frequency: Dict[str, float]
     clauses: int
     dependency_distance: float
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMJudgeMetrics:
     straight_tell: str
     sample_comparison: str
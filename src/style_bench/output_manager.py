@@ -2,10 +2,54 @@
 
 import yaml
 import json
+import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import pickle
-from dataclasses import asdict
+from dataclasses import asdict, is_dataclass
+
+try:
+    import orjson
+except ImportError:  # optional "fast" extra, falls back to the stdlib encoder
+    orjson = None
+
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _write_json(path: Path, data) -> None:
+    """Write data as indented JSON, using orjson when it is installed
+
+    Both encoders write the same file: two-space indents, UTF-8 text and
+    null for NaN or infinite values, which strict JSON has no literal for.
+    """
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+        return
+
+    path.write_text(
+        json.dumps(_to_builtin(data), indent=2, ensure_ascii=False, allow_nan=False),
+        encoding="utf-8",
+    )
+
+
+def _to_builtin(obj):
+    """Convert dataclasses and numpy values for the stdlib encoder, and
+    non-finite floats to None"""
+    if is_dataclass(obj):
+        return _to_builtin(asdict(obj))
+    if isinstance(obj, dict):
+        return {key: _to_builtin(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_builtin(value) for value in obj]
+    if hasattr(obj, "tolist"):
+        return _to_builtin(obj.tolist())
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    return obj
 
 
 class OutputManager:
@@ -15,27 +59,28 @@ class OutputManager:
         # Create output directory
         self.config = config
         self.results = results
+        self.timestamp = datetime.now()
         self.output_path = self._get_path()
         self.output_path.mkdir(parents=True, exist_ok=True)
 
-        # Save metadata
-        self._save_metadata()
-
-        # save texts
-        self._save_texts(texts)
-
-        # Save config
-        self._save_config()
-
-        # Save results
-        self._save_results()
+        # The files are independent, so write metadata, texts, config and
+        # results concurrently; result() re-raises any failure
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self._save_metadata),
+                executor.submit(self._save_texts, texts),
+                executor.submit(self._save_config),
+                executor.submit(self._save_results),
+            ]
+            for future in futures:
+                future.result()
 
         return str(self.output_path)
 
     def _get_path(self) -> str:
         path = Path(self.config.data.output_path)
         experiment_name = self.config.experiment_name.replace(" ", "_").lower()
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp = self.timestamp.strftime("%Y-%m-%d_%H-%M-%S")
         output_path = path / f"{experiment_name}_{timestamp}"
         return Path(output_path)
 
@@ -43,47 +88,43 @@ class OutputManager:
         metadata = {
             "experiment_name": self.config.experiment_name,
             "description": self.config.description,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self.timestamp.isoformat(),
         }
         metadata_path = self.output_path / "metadata.json"
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=4)
+        _write_json(metadata_path, metadata)
 
     def _save_config(self) -> None:
         """Save the configuration used for the analysis"""
         config_path = self.output_path / "config.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump(self.config.dict(), f, default_flow_style=False)
+        config_path.write_text(
+            yaml.dump(
+                self.config.model_dump(mode="json"),
+                Dumper=Dumper,
+                default_flow_style=False,
+            )
+        )
 
     def _save_texts(self, texts: list[str]) -> None:
         """Save the original texts used for analysis"""
         texts_path = self.output_path / "texts.json"
-        with open(texts_path, "w") as f:
-            json.dump(texts, f, indent=4)
+        _write_json(texts_path, texts)
 
     def _save_results(self) -> None:
-        # as a pickle
-        results_path = self.output_path / "results.pkl"
-        with open(results_path, "wb") as f:
-            pickle.dump(self.results, f)
+        # as a pickle, only on request since the JSON already holds the results
+        if self.config.data.save_pickle:
+            results_path = self.output_path / "results.pkl"
+            results_path.write_bytes(pickle.dumps(self.results))
 
-        # Save as JSON (convert dataclass to dict if necessary)
+        # Save as JSON
         results_json_path = self.output_path / "results.json"
-        with open(results_json_path, "w") as f:
-            try:
-                # Try to convert dataclass to dict
-                if hasattr(self.results, "__dataclass_fields__"):
-                    json_data = asdict(self.results)
-                else:
-                    json_data = self.results
-                json.dump(json_data, f, indent=4)
-            except (TypeError, ValueError) as e:
-                # If serialization fails, save a string representation
-                json.dump(
-                    {
-                        "error": f"Could not serialize results: {str(e)}",
-                        "results_str": str(self.results),
-                    },
-                    f,
-                    indent=4,
-                )
+        try:
+            _write_json(results_json_path, self.results)
+        except (TypeError, ValueError) as e:
+            # If serialization fails, save a string representation
+            _write_json(
+                results_json_path,
+                {
+                    "error": f"Could not serialize results: {str(e)}",
+                    "results_str": str(self.results),
+                },
+            )
@@ -1,6 +1,11 @@
 import json
 from typing import List
 
+try:
+    import orjson
+except ImportError:  # optional "fast" extra, falls back to the stdlib parser
+    orjson = None
+
 
 def extract_texts(file_path: str, target_key: str) -> List[str]:
     """Extract texts from JSON file
@@ -13,11 +18,12 @@ def extract_texts(file_path: str, target_key: str) -> List[str]:
         List[str]: List of extracted text values
     """
     try:
-        with open(file_path, "r") as f:
-            json_data = json.load(f)
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        json_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except FileNotFoundError:
         raise ValueError(f"File not found: {file_path}")
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson's error subclasses this too
         raise ValueError(f"Invalid JSON file: {e}")
 
     if not isinstance(json_data, list):
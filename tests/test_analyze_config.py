@@ -1,4 +1,5 @@
 # tests/test_config.py
+import os
 import pytest
 import tempfile
 import json
@@ -13,6 +14,7 @@ from style_bench.config import (
     DataConfig,
     AnalysisConfig,
     load_config,
+    _load_config_cached,
 )
 
 
@@ -65,6 +67,12 @@ class TestLexicalConfig:
         assert config.richness.mattr is False
         assert config.richness.mtld is False
 
+    def test_workers_must_be_positive(self):
+        assert LexicalConfig().workers is None
+        assert LexicalConfig(workers=1).workers == 1
+        with pytest.raises(ValidationError):
+            LexicalConfig(workers=0)
+
     def test_nested_richness_dict(self):
         # Test that we can pass richness as a dict
         config = LexicalConfig(richness={"mattr": False, "mtld": True})
@@ -91,8 +99,7 @@ class TestDataConfig:
                 config = DataConfig(data_path=temp_json_path, output_path=temp_dir)
                 assert config.data_path == temp_json_path
                 assert config.output_path == temp_dir
-                # Check that output directory was created
-                assert Path(temp_dir).exists()
+                assert config.save_pickle is False
         finally:
             Path(temp_json_path).unlink()
 
@@ -119,7 +126,7 @@ class TestDataConfig:
         finally:
             Path(temp_txt_path).unlink()
 
-    def test_output_path_creation(self):
+    def test_output_path_not_created(self):
         # Create a temporary JSON file for data_path
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
             json.dump({"test": "data"}, f)
@@ -133,9 +140,8 @@ class TestDataConfig:
                     data_path=temp_json_path, output_path=str(nested_output_path)
                 )
 
-                # Check that nested directories were created
-                assert nested_output_path.exists()
-                assert nested_output_path.is_dir()
+                # Validation has no side effects; OutputManager creates it
+                assert not nested_output_path.exists()
         finally:
             Path(temp_json_path).unlink()
 
@@ -234,15 +240,94 @@ class TestLoadConfig:
             assert config.syntactic.clauses is False
             assert config.data.data_path == valid_json_file
 
-            # Check that output directory was created
-            assert Path("test_output").exists()
-
         finally:
             Path(config_path).unlink()
             # Clean up created output directory
             if Path("test_output").exists():
                 Path("test_output").rmdir()
 
+    def test_load_config_does_not_create_output_path(self, valid_json_file):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "nested" / "output"
+            config_path = Path(temp_dir) / "config.yaml"
+            config_path.write_text(
+                yaml.dump(
+                    {
+                        "experiment_name": "no_side_effects",
+                        "data": {
+                            "data_path": valid_json_file,
+                            "output_path": str(output_path),
+                        },
+                    }
+                )
+            )
+
+            config = load_config(str(config_path))
+
+            # OutputManager creates the directory when results are saved
+            assert config.data.output_path == str(output_path)
+            assert not output_path.exists()
+
+    def test_load_config_cached_until_modified(self, valid_json_file):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_data = {
+                "experiment_name": "first",
+                "data": {"data_path": valid_json_file, "output_path": temp_dir},
+            }
+            config_path = Path(temp_dir) / "config.yaml"
+            config_path.write_text(yaml.dump(config_data))
+
+            _load_config_cached.cache_clear()
+            first = load_config(str(config_path))
+            second = load_config(str(config_path))
+
+            # The second load is served from the cache without parsing
+            assert _load_config_cached.cache_info().hits == 1
+            assert _load_config_cached.cache_info().misses == 1
+
+            # Callers get equal but independent copies
+            assert first == second
+            assert first is not second
+            first.lexical.sentiment.batch_size = 1
+            assert second.lexical.sentiment.batch_size == 64
+
+            # Rewriting the file invalidates the cached entry
+            config_data["experiment_name"] = "second"
+            config_path.write_text(yaml.dump(config_data))
+            stat = config_path.stat()
+            os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+            assert load_config(str(config_path)).experiment_name == "second"
+            assert _load_config_cached.cache_info().hits == 1
+            assert _load_config_cached.cache_info().misses == 2
+
+    def test_load_config_rechecks_data_path(self, valid_json_file):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_path = Path(temp_dir) / "data.json"
+            data_path.write_text(Path(valid_json_file).read_text())
+            config_path = Path(temp_dir) / "config.yaml"
+            config_path.write_text(
+                yaml.dump(
+                    {
+                        "experiment_name": "relative",
+                        "data": {"data_path": "data.json", "output_path": temp_dir},
+                    }
+                )
+            )
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(temp_dir)
+                assert load_config(str(config_path)).data.data_path == "data.json"
+
+                # The cached config must not hide a data path that no
+                # longer resolves from the working directory
+                os.chdir(cwd)
+                with pytest.raises(ValidationError):
+                    load_config(str(config_path))
+            finally:
+                os.chdir(cwd)
+
     def test_load_nonexistent_config(self):
         with pytest.raises(FileNotFoundError):
             load_config("nonexistent.yaml")
@@ -324,7 +409,6 @@ class TestConfigIntegration:
             assert config.lexical.richness.mattr is True
             assert config.lexical.function_words is False
             assert config.syntactic.clauses is False
-            assert Path(config.data.output_path).exists()
 
         finally:
             # Cleanup
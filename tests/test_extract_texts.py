@@ -3,6 +3,7 @@ import json
 import tempfile
 import os
 
+from style_bench import utils
 from style_bench.utils import extract_texts
 
 
@@ -62,6 +63,28 @@ def test_extract_texts_invalid_json():
         os.unlink(temp_path)
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_extract_texts_invalid_json_parsers(use_orjson, monkeypatch):
+    """Test that orjson and the stdlib fallback report malformed JSON alike"""
+    if use_orjson:
+        orjson = pytest.importorskip("orjson")
+        # extract_texts only catches json.JSONDecodeError
+        assert issubclass(orjson.JSONDecodeError, json.JSONDecodeError)
+        monkeypatch.setattr(utils, "orjson", orjson)
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        f.write('{"invalid": json}')  # Invalid JSON
+        temp_path = f.name
+
+    try:
+        with pytest.raises(ValueError, match="Invalid JSON file"):
+            extract_texts(temp_path, "answer")
+    finally:
+        os.unlink(temp_path)
+
+
 def test_extract_texts_not_list():
     """Test validation when JSON is not a list"""
     data = {"not": "a list"}
@@ -0,0 +1,221 @@
+from dataclasses import fields
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from style_bench import lexical
+from style_bench.config import LexicalConfig
+from style_bench.lexical import (
+    MIN_TEXTS_PER_WORKER,
+    LexicalComputer,
+    METRIC_STEPS,
+    WORD_PATTERN,
+    _analyze_text,
+    _calculate_legomena,
+    _calculate_word_length,
+    _check_emotion_labels,
+    _count_tokens,
+    _enabled_metrics,
+    _central_moments,
+    _central_moments_loop,
+    _central_moments_numpy,
+    _moving_average_ttr,
+    _moving_average_ttr_loop,
+    _moving_average_ttr_numpy,
+    _worker_count,
+)
+
+STOP_WORDS = frozenset({"the", "a", "of", "and"})
+
+
+def test_word_pattern():
+    """Test that accented letters, digits and apostrophes stay inside words"""
+    text = "Naïve café-goers don't pay €5 in 1984, word0 and word29!"
+
+    assert WORD_PATTERN.findall(text.lower()) == [
+        "naïve",
+        "café",
+        "goers",
+        "don't",
+        "pay",
+        "5",
+        "in",
+        "1984",
+        "word0",
+        "and",
+        "word29",
+    ]
+
+
+def test_count_tokens():
+    """Test the word and function word counts"""
+    words = ["the", "cat", "and", "the", "hat"]
+    word_counts, function_word_count = _count_tokens(words, STOP_WORDS)
+
+    assert word_counts == {"the": 2, "cat": 1, "and": 1, "hat": 1}
+    assert function_word_count == 3
+
+
+def test_word_length_matches_scipy():
+    """Test that the moments match the scipy defaults"""
+    lengths = [1, 3, 3, 4, 7, 2, 9, 5, 5, 3]
+    result = _calculate_word_length(["x" * length for length in lengths])
+
+    expected = (
+        np.mean(lengths),
+        np.std(lengths),
+        stats.skew(lengths),
+        stats.kurtosis(lengths),
+    )
+    assert result == pytest.approx(expected)
+
+
+def test_word_length_empty_and_constant():
+    """Test degenerate inputs"""
+    assert _calculate_word_length([]) == (0.0, 0.0, 0.0, 0.0)
+
+    mean, std, skew, kurtosis = _calculate_word_length(["word", "text", "four"])
+    assert (mean, std) == (4.0, 0.0)
+    assert np.isnan(skew) and np.isnan(kurtosis)
+
+
+@pytest.mark.parametrize(
+    "moving_average_ttr",
+    [_moving_average_ttr, _moving_average_ttr_numpy, _moving_average_ttr_loop],
+)
+def test_moving_average_ttr_matches_brute_force(moving_average_ttr):
+    """Test every MATTR kernel against the set-per-window definition"""
+    rng = np.random.default_rng(0)
+    ids = rng.integers(0, 20, size=250).astype(np.int32)
+
+    for window in (1, 7, 100, 250):
+        expected = np.mean(
+            [
+                len(set(ids[i : i + window].tolist())) / window
+                for i in range(ids.size - window + 1)
+            ]
+        )
+        assert moving_average_ttr(ids, 20, window) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "central_moments",
+    [_central_moments, _central_moments_numpy, _central_moments_loop],
+)
+def test_central_moments(central_moments):
+    """Test every moment kernel against NumPy"""
+    values = np.array([1, 3, 3, 4, 7, 2, 9, 5, 5, 3], dtype=np.int32)
+    d = values - values.mean()
+
+    assert central_moments(values) == pytest.approx(
+        (values.mean(), np.mean(d**2), np.mean(d**3), np.mean(d**4))
+    )
+
+
+def test_calculate_legomena():
+    """Test hapax, dislegomena and trilegomina ratios"""
+    word_counts = {"a": 1, "b": 1, "c": 2, "d": 3, "e": 4}
+
+    assert _calculate_legomena(word_counts, 11) == pytest.approx(
+        (2 / 11, 1 / 11, 1 / 11)
+    )
+    assert _calculate_legomena({}, 0) == (0, 0, 0)
+
+
+def test_analyze_text():
+    """Test the per-text metrics on a short text"""
+    values = _analyze_text(
+        "The cat, the hat!", tuple(METRIC_STEPS.values()), STOP_WORDS
+    )
+
+    function_words, avg_word_length = values[:2]
+    assert len(values) == 10
+    assert function_words == pytest.approx(0.5)
+    assert avg_word_length == pytest.approx(3.0)
+    assert values[5:7] == pytest.approx([0.75, 0.75])
+    assert values[7:] == pytest.approx([0.5, 0.25, 0.0])
+
+
+def test_analyze_text_disabled_metrics():
+    """Test that only the enabled steps run"""
+    metrics = _enabled_metrics(LexicalConfig(function_words=False, word_length=False))
+    assert metrics == {"richness", "legomena"}
+
+    steps = tuple(step for name, step in METRIC_STEPS.items() if name in metrics)
+    values = _analyze_text("Some text", steps, STOP_WORDS)
+    assert values == pytest.approx([1.0, 1.0, 1.0, 0.0, 0.0])
+
+
+def test_analyze_text_without_words():
+    """Test the fast path for texts with nothing to measure"""
+    assert _analyze_text("", tuple(METRIC_STEPS.values()), STOP_WORDS) is None
+    assert _analyze_text("?! — ...", tuple(METRIC_STEPS.values()), STOP_WORDS) is None
+
+
+def test_check_emotion_labels():
+    """Test that sentiment model labels must name the result emotions"""
+    emotions = ["anger", "disgust", "fear", "joy", "neutral", "sadness", "surprise"]
+    _check_emotion_labels("model", emotions)
+    _check_emotion_labels("model", [emotion.title() for emotion in emotions])
+
+    with pytest.raises(ValueError, match="LABEL_0"):
+        _check_emotion_labels("model", [f"LABEL_{i}" for i in range(7)])
+    with pytest.raises(ValueError, match="surprise"):
+        _check_emotion_labels("model", emotions[:-1])
+
+
+def test_analyze_corpus(monkeypatch):
+    """Test deduplication, row collation, wordless texts and sentiment fill"""
+    emotions = ["anger", "disgust", "fear", "joy", "neutral", "sadness", "surprise"]
+
+    def classifier(texts, **kwargs):
+        # Like the pipeline, predictions come sorted by score, not by label
+        scores = {emotion: (i + 1) / 28 for i, emotion in enumerate(emotions)}
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return [
+            [{"label": label, "score": score} for label, score in ranked] for _ in texts
+        ]
+
+    monkeypatch.setattr(lexical, "_ensure_nltk_data", lambda: None)
+    monkeypatch.setattr(lexical, "_load_stop_words", lambda: STOP_WORDS)
+    monkeypatch.setattr(
+        LexicalComputer, "_load_classifier", lambda self, model_name: classifier
+    )
+
+    metrics = LexicalComputer(LexicalConfig(workers=1)).analyze_corpus(
+        ["a b", "", "a b"]
+    )
+
+    def rows(group):
+        return np.column_stack([getattr(group, f.name) for f in fields(group)])
+
+    lexical_rows = np.column_stack(
+        [
+            metrics.function_word_frequency,
+            rows(metrics.word_length),
+            rows(metrics.richness),
+            rows(metrics.legomena),
+        ]
+    )
+    assert lexical_rows.shape == (3, 10)
+    np.testing.assert_array_equal(lexical_rows[0], lexical_rows[2])
+    np.testing.assert_array_equal(lexical_rows[1], np.zeros(10))
+    assert metrics.function_word_frequency[0] == pytest.approx(0.5)
+    assert metrics.richness.ttr[0] == pytest.approx(1.0)
+
+    for i, emotion in enumerate(emotions):
+        np.testing.assert_allclose(
+            getattr(metrics.sentiment, emotion), np.full(3, (i + 1) / 28)
+        )
+
+
+def test_worker_count(monkeypatch):
+    """Test that small corpora run in-process and workers scale with size"""
+    monkeypatch.setattr(lexical.os, "cpu_count", lambda: 8)
+
+    assert _worker_count(None, 105) == 1
+    assert _worker_count(4, MIN_TEXTS_PER_WORKER - 1) == 1
+    assert _worker_count(None, 3 * MIN_TEXTS_PER_WORKER) == 3
+    assert _worker_count(4, 100 * MIN_TEXTS_PER_WORKER) == 4
+    assert _worker_count(None, 100 * MIN_TEXTS_PER_WORKER) == 8
@@ -0,0 +1,47 @@
+import json
+
+import numpy as np
+import pytest
+
+from style_bench import output_manager
+from style_bench.models import Richness
+
+EXPECTED_JSON = """{
+  "metrics": {
+    "ttr": [
+      null,
+      1.5,
+      null
+    ],
+    "mattr": []
+  },
+  "texts": [
+    "naïve café"
+  ]
+}""".encode()
+
+
+@pytest.fixture
+def results():
+    return {
+        "metrics": Richness(ttr=np.array([np.nan, 1.5, np.inf])),
+        "texts": ["naïve café"],
+    }
+
+
+def test_write_json_fallback(tmp_path, monkeypatch, results):
+    """Test that the stdlib fallback writes strict, two-space indented UTF-8"""
+    monkeypatch.setattr(output_manager, "orjson", None)
+    output_manager._write_json(tmp_path / "results.json", results)
+
+    written = (tmp_path / "results.json").read_bytes()
+    assert written == EXPECTED_JSON
+    assert json.loads(written)["metrics"]["ttr"] == [None, 1.5, None]
+
+
+@pytest.mark.skipif(output_manager.orjson is None, reason="orjson not installed")
+def test_write_json_orjson(tmp_path, results):
+    """Test that orjson writes the same file as the fallback"""
+    output_manager._write_json(tmp_path / "results.json", results)
+
+    assert (tmp_path / "results.json").read_bytes() == EXPECTED_JSON